@@ -3,13 +3,18 @@ User inputs are sample size and probability of failure. Binomial model class set
 Binomial plot class takes in the binomial model and generates plots.
 """
 
+import os
+import sys
+
 import numpy as np
 import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.widgets import TextBox
-import seaborn as sns
 from typing import Final, Union
-from scipy.stats import binom
+
+# Make the repo root importable so the shared numba kernels can be found when running from this directory
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+import fast_binom as fb
 
 # Binomial distribution default parameters
 SAMPLE_SIZE: Final[int] = 100
@@ -49,35 +54,18 @@ class binomial_model:
         """Regenerates data sets for number of fails, probability density and cumulative probability density.
         """
 
-        # Not sure how many elements to include in each data array so initialise each with the max possible length
-        # Set up horizontal axis data of integer number of fails
-        self.x_data = np.arange(0, self.n+1)
-        # Set up vertical axes data of probability of getting x number of fails
-        self.pmf_data = np.empty(len(self.x_data))
-        self.cdf_data = np.empty(len(self.x_data))
-
-        # Don't want to start from 0 to save time and resources, unless necessary
-        # Expect peak no. of fail around pfail * n so start slightly less than that
-        cmin = round(0.75 * self.pfail * self.n)
-        i = 0
-        for c in np.arange(cmin, self.n+1):
-            # Set horizontal axis point
-            self.x_data[i] = c
-            # Get vertical axes data
-            self.pmf_data[i] = binom.pmf(c, self.n, self.pfail)
-            self.cdf_data[i] = binom.cdf(c, self.n, self.pfail)
-
-            # Break the loop once the CDF gets close enough to its max allowed value of 1.0
-            # Try to stop early to make code more responsive
-            if self.cdf_data[i] > 1-TOL:
-                break
-
-            i += 1
-
-        # Now we know number of elements needed, cut off elements beyond that
-        self.x_data = self.x_data[0:i+1]
-        self.pmf_data = self.pmf_data[0:i+1]
-        self.cdf_data = self.cdf_data[0:i+1]
+        # Rare-event regime: the Poisson limit is accurate and its distribution is
+        # concentrated near n*pfail, so the truncation kicks in after a few dozen terms
+        if self.n * self.pfail < 10 and self.pfail < 0.01:
+            self.pmf_data = fb.poisson_pmf_truncated(self.n * self.pfail, self.n, TOL)
+            self.cdf_data = np.cumsum(self.pmf_data)
+            self.x_data = np.arange(0, len(self.pmf_data))
+            return
+
+        # One fused kernel pass builds the pmf, accumulates the cdf and stops
+        # as soon as the CDF gets close enough to its max allowed value of 1.0
+        self.pmf_data, self.cdf_data = fb.binom_truncated(self.n, self.pfail, TOL)
+        self.x_data = np.arange(0, len(self.pmf_data))
 
     def update_pfail(self, pfail:float)->None:
         """Method to update the pfail value.
@@ -105,9 +93,21 @@ class binomial_plot:
         # Generate canvas
         self.generate_figure()
 
+        # Recapture backgrounds and repaint the bars after any full redraw, so
+        # resizes, pans and stray draws never erase the animated bar patches
+        self.fig.canvas.mpl_connect('draw_event', self.on_draw)
+
         # Generate plots
         self.generate_plots()
 
+        # Parameters behind the current plots, for skipping no-op updates
+        self._last_params = (self.model.n, self.model.pfail)
+
+        # Single-shot timer so rapid submits collapse into one rebuild
+        self._debounce = self.fig.canvas.new_timer(interval=50)
+        self._debounce.single_shot = True
+        self._debounce.add_callback(self.update_data)
+
     def generate_figure(self)->None:
         """Set up the figure canvas including plot axes and input text boxes.
         """
@@ -123,7 +123,10 @@ class binomial_plot:
         self.make_n_tbox()
 
     def generate_plots(self)->None:
-        """Set up plot axes and generate the plots.
+        """Set up plot axes and generate the plots. This is the full rebuild path.
+
+        The bar patches are marked animated so the background snapshot taken here
+        excludes them, enabling the blit fast path in update_data.
         """
 
         # Clear the axes so that plots don't drawn on top of each other
@@ -132,39 +135,110 @@ class binomial_plot:
 
         # Generate plots
         # Note this must be done before setting axis properties, or else will be a mess
-        sns.barplot(x=self.model.x_data, y=self.model.pmf_data, ax=self.ax0, color = 'Orange')
-        sns.barplot(x=self.model.x_data, y=self.model.cdf_data, ax=self.ax1, color = 'Green')
+        # Plain ax.bar draws the rectangles directly with none of seaborn's aggregation overhead
+        pmf_container = self.ax0.bar(self.model.x_data, self.model.pmf_data, color = 'orange')
+        cdf_container = self.ax1.bar(self.model.x_data, self.model.cdf_data, color = 'green')
 
+        # Static decorations, redone only because cla() wiped them
+        self.setup_axes()
+
+        # Rescale to the new data
+        self.ax0.set_ylim(auto=True)
+        for x in [self.ax0, self.ax1]:
+            x.relim()
+            x.autoscale_view()
+
+        # Keep hold of the bar patches and exclude them from the static background
+        self._pmf_bars = list(pmf_container)
+        self._cdf_bars = list(cdf_container)
+        for rect in self._pmf_bars + self._cdf_bars:
+            rect.set_animated(True)
+
+        # Render the static parts (axes, ticks, grid, titles) once; the draw_event
+        # fired by this synchronous draw runs on_draw, which snapshots the
+        # backgrounds and paints the bars on top
+        self.fig.canvas.draw()
+
+    def setup_axes(self)->None:
+        """Apply the static axis decorations: titles, labels, grid, tick locators.
+
+        These do not depend on the plotted data, so they only need re-applying
+        after the axes have been cleared in the full rebuild path.
+        """
         # Plot titles
         self.ax0.set_title("Probability Density Function", weight="bold")
-        self.ax1.set_title("Cumulative Density Function", weight="bold")        
-        
+        self.ax1.set_title("Cumulative Density Function", weight="bold")
+
         # Plot axis labels and grid
         self.ax0.set_ylabel("Probability")
-        self.ax1.set_ylabel("Cumulative Probability")        
-        self.ax0.set_ylim(auto=True)
+        self.ax1.set_ylabel("Cumulative Probability")
         self.ax1.set_ylim(top = 1.0)
 
         for x in [self.ax0, self.ax1]:
             x.set_xlabel("Number Of Fails")
-            x.set_xticklabels(x.get_xticklabels(), rotation=45)
+            x.tick_params(axis='x', rotation=45)
             x.grid(visible=True, which='both', axis='y')
             x.xaxis.set_major_locator(matplotlib.ticker.MultipleLocator(5))
             x.xaxis.set_major_formatter(matplotlib.ticker.ScalarFormatter())
-            x.relim()
-            x.autoscale_view()
-        
-        # This is needed to force the plot to refresh or there will be some delay
-        self.fig.canvas.draw() 
+
+    def on_draw(self, event)->None:
+        """Recapture the static backgrounds and repaint the bars after any full redraw.
+
+        Connected to draw_event so resizes and deferred redraws keep the cached
+        backgrounds in sync with the canvas.
+
+        Args:
+            event: Matplotlib draw event.
+        """
+        self._bg = {x: self.fig.canvas.copy_from_bbox(x.bbox) for x in [self.ax0, self.ax1]}
+        for x, bars in [(self.ax0, self._pmf_bars), (self.ax1, self._cdf_bars)]:
+            for rect in bars:
+                x.draw_artist(rect)
+
+    def blit_bars(self)->None:
+        """Redraw only the bar patches over the cached static background and blit.
+        """
+        for x, bars in [(self.ax0, self._pmf_bars), (self.ax1, self._cdf_bars)]:
+            self.fig.canvas.restore_region(self._bg[x])
+            for rect in bars:
+                x.draw_artist(rect)
+            self.fig.canvas.blit(x.bbox)
+        self.fig.canvas.flush_events()
 
     def update_data(self)->None:
-        """Update the binomial model data and then regenerate plots with new data.
+        """Update the binomial model data and then refresh the plots with new data.
+
+        Uses the blit fast path when the number of bars and the y range still fit,
+        otherwise falls back to the full rebuild.
         """
+        # Nothing to do if the parameters behind the current plots are unchanged
+        new_params = (self.model.n, self.model.pfail)
+        if new_params == self._last_params:
+            return
+        self._last_params = new_params
+
         # Update the model to generate new data
         self.model.reset_model()
 
-        # Update the plots
+        # Fast path: same bar count and the new heights fit the current y range,
+        # so only the bar heights need redrawing
+        if (len(self.model.x_data) == len(self._pmf_bars)
+                and float(np.max(self.model.pmf_data)) <= self.ax0.get_ylim()[1]):
+            for rect, h in zip(self._pmf_bars, self.model.pmf_data):
+                rect.set_height(h)
+            for rect, h in zip(self._cdf_bars, self.model.cdf_data):
+                rect.set_height(h)
+            self.blit_bars()
+            return
+
+        # Slow path: bar count or scale changed, rebuild the plots
         self.generate_plots()
+
+    def schedule_update(self)->None:
+        """Restart the debounce timer so the rebuild runs once the submits settle.
+        """
+        self._debounce.stop()
+        self._debounce.start()
         
     def make_pfail_tbox(self)->None:
         """Set up the user input box for probability of failure.
@@ -199,7 +273,7 @@ class binomial_plot:
 
         print(f"New pfail {pfail}")
         self.model.update_pfail(pfail)
-        self.update_data()
+        self.schedule_update()
 
     def make_n_tbox(self)->None:
         """Set up the user input sample size text box.
@@ -234,7 +308,7 @@ class binomial_plot:
 
         print(f"Sample size {n}")
         self.model.update_n(n)
-        self.update_data()        
+        self.schedule_update()
 
 if __name__ == '__main__':
     # Entry point into main code
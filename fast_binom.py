@@ -0,0 +1,280 @@
+"""Numba JIT compiled kernels for binomial distribution hot paths.
+
+The pmf is generated from the recurrence pmf[k+1] = pmf[k] * (n-k)/(k+1) * p/(1-p)
+with pmf[0] = (1-p)**n, so each kernel is one tight compiled loop with no scipy
+dispatch overhead. When the k=0 seed would underflow (large n*p), the recurrence
+is instead seeded at the distribution mode from a gammaln-based log pmf.
+Intended for the moderate n used by the interactive plotters.
+"""
+import math
+
+import numba as nb
+import numpy as np
+
+# Below this log pmf the k=0 seed underflows to 0.0 in float64 and the upward
+# recurrence would zero out the entire distribution
+_LOG_UNDERFLOW = -700.0
+
+
+@nb.njit(fastmath=True, cache=True)
+def _log_pmf(k:int, n:int, p:float)->float:
+    """Binomial log pmf at a single (k, n, p) via lgamma, safe for any n.
+
+    Args:
+        k (int): Number of fails.
+        n (int): Sample size.
+        p (float): Probability of failure, strictly inside (0, 1).
+
+    Returns:
+        float: log pmf value at k.
+    """
+    return (math.lgamma(n+1.0) - math.lgamma(k+1.0) - math.lgamma(n-k+1.0)
+            + k*math.log(p) + (n-k)*math.log1p(-p))
+
+
+@nb.njit(fastmath=True, cache=True)
+def pmf_array(n:int, p:float)->np.ndarray:
+    """Binomial pmf for every number of fails k = 0..n at fixed (n, p).
+
+    Args:
+        n (int): Sample size.
+        p (float): Probability of failure.
+
+    Returns:
+        np.ndarray: pmf values for k = 0..n.
+    """
+    pmf = np.zeros(n+1)
+    # Degenerate p values put all the probability mass on a single outcome
+    if p <= 0.0:
+        pmf[0] = 1.0
+        return pmf
+    elif p >= 1.0:
+        pmf[n] = 1.0
+        return pmf
+
+    ratio = p / (1.0-p)
+    log_p0 = n * math.log1p(-p)
+    if log_p0 > _LOG_UNDERFLOW:
+        pmf[0] = math.exp(log_p0)
+        for k in range(n):
+            pmf[k+1] = pmf[k] * ratio * (n-k) / (k+1)
+        return pmf
+
+    # The k=0 seed underflows; seed at the mode instead and run the recurrence
+    # outward in both directions, letting the far tails flush to 0 harmlessly
+    km = min(int((n+1) * p), n)
+    pmf[km] = math.exp(_log_pmf(km, n, p))
+    for k in range(km, n):
+        pmf[k+1] = pmf[k] * ratio * (n-k) / (k+1)
+    for k in range(km, 0, -1):
+        pmf[k-1] = pmf[k] * k / (ratio * (n-k+1))
+    return pmf
+
+
+@nb.njit(fastmath=True, cache=True)
+def cdf_array(n:int, p:float)->np.ndarray:
+    """Binomial cdf for every number of fails k = 0..n at fixed (n, p).
+
+    Args:
+        n (int): Sample size.
+        p (float): Probability of failure.
+
+    Returns:
+        np.ndarray: cdf values for k = 0..n.
+    """
+    cdf = pmf_array(n, p)
+    for k in range(n):
+        cdf[k+1] = cdf[k] + cdf[k+1]
+    return cdf
+
+
+@nb.njit(fastmath=True, cache=True)
+def pmf_at_k(k:int, n:int, p_grid:np.ndarray)->np.ndarray:
+    """Binomial pmf of a fixed number of fails k over a grid of p values.
+
+    Args:
+        k (int): Number of fails.
+        n (int): Sample size.
+        p_grid (np.ndarray): Probability of failure values.
+
+    Returns:
+        np.ndarray: pmf of k fails at each p in the grid.
+    """
+    y = np.empty(p_grid.size)
+    for i in range(p_grid.size):
+        p = p_grid[i]
+        if p <= 0.0:
+            y[i] = 1.0 if k == 0 else 0.0
+        elif p >= 1.0:
+            y[i] = 1.0 if k == n else 0.0
+        else:
+            log_p0 = n * math.log1p(-p)
+            if log_p0 > _LOG_UNDERFLOW:
+                pk = math.exp(log_p0)
+                ratio = p / (1.0-p)
+                for kk in range(k):
+                    pk = pk * ratio * (n-kk) / (kk+1)
+                y[i] = pk
+            else:
+                # The k=0 seed underflows; evaluate the term directly in log space
+                y[i] = math.exp(_log_pmf(k, n, p))
+    return y
+
+
+@nb.njit(fastmath=True, cache=True)
+def binom_truncated(n:int, p:float, tol:float):
+    """Binomial pmf and cdf in one fused recurrence loop with early termination.
+
+    Computes each pmf term, accumulates the cdf alongside it, and stops as soon
+    as the remaining tail mass drops below tol — one pass, no intermediate
+    arrays, no separate cumsum or searchsorted step.
+
+    Args:
+        n (int): Sample size.
+        p (float): Probability of failure.
+        tol (float): Truncation tolerance on the remaining tail mass.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: pmf and cdf for k = 0 up to the truncation point.
+    """
+    pmf = np.zeros(n+1)
+    cdf = np.empty(n+1)
+    # Degenerate p values put all the probability mass on a single outcome
+    if p <= 0.0:
+        pmf[0] = 1.0
+        return pmf[:1], np.ones(1)
+    elif p >= 1.0:
+        pmf[n] = 1.0
+        return pmf, np.cumsum(pmf)
+
+    ratio = p / (1.0-p)
+    log_p0 = n * math.log1p(-p)
+    if log_p0 > _LOG_UNDERFLOW:
+        pmf[0] = math.exp(log_p0)
+        km = 0
+        cdf[0] = pmf[0]
+    else:
+        # The k=0 seed underflows; seed at the mode, fill the lower tail by the
+        # downward recurrence, then resume the fused upward loop from the mode
+        km = min(int((n+1) * p), n)
+        pmf[km] = math.exp(_log_pmf(km, n, p))
+        for k in range(km, 0, -1):
+            pmf[k-1] = pmf[k] * k / (ratio * (n-k+1))
+        acc = 0.0
+        for k in range(km+1):
+            acc = acc + pmf[k]
+            cdf[k] = acc
+    for k in range(km, n):
+        pmf[k+1] = pmf[k] * ratio * (n-k) / (k+1)
+        cdf[k+1] = cdf[k] + pmf[k+1]
+        if cdf[k+1] > 1.0-tol:
+            return pmf[:k+2], cdf[:k+2]
+    return pmf, cdf
+
+
+@nb.njit(fastmath=True, cache=True)
+def poisson_pmf_truncated(lam:float, nmax:int, tol:float)->np.ndarray:
+    """Poisson pmf from the recurrence pmf[k+1] = pmf[k] * lam/(k+1), truncated early.
+
+    Approximates the binomial pmf in the rare-event limit (small p, lam = n*p).
+    Stops as soon as the accumulated mass reaches 1 - tol, which for small lam
+    happens after only a few dozen terms.
+
+    Args:
+        lam (float): Poisson mean, n * p for the binomial being approximated.
+        nmax (int): Max number of fails, i.e. the binomial sample size.
+        tol (float): Truncation tolerance on the remaining tail mass.
+
+    Returns:
+        np.ndarray: pmf values for k = 0 up to the truncation point.
+    """
+    pmf = np.zeros(nmax+1)
+    pmf[0] = math.exp(-lam)
+    cdf = pmf[0]
+    for k in range(nmax):
+        pmf[k+1] = pmf[k] * lam / (k+1)
+        cdf = cdf + pmf[k+1]
+        if cdf > 1.0-tol:
+            return pmf[:k+2]
+    return pmf
+
+
+@nb.njit(fastmath=True, cache=True)
+def _binom_cdf_scalar(k:int, n:int, p:float)->float:
+    """Binomial cdf at a single (k, n, p) via the pmf recurrence.
+
+    Args:
+        k (int): Acceptance number.
+        n (int): Sample size.
+        p (float): Probability of failure.
+
+    Returns:
+        float: cdf value at k.
+    """
+    if p <= 0.0:
+        return 1.0
+    elif p >= 1.0:
+        return 1.0 if k >= n else 0.0
+
+    ratio = p / (1.0-p)
+    log_p0 = n * math.log1p(-p)
+    if log_p0 > _LOG_UNDERFLOW:
+        pk = math.exp(log_p0)
+        acc = pk
+        for kk in range(k):
+            pk = pk * ratio * (n-kk) / (kk+1)
+            acc = acc + pk
+        return acc
+
+    # The k=0 seed underflows; accumulate outward from the largest term in
+    # 0..k (the mode, or k itself when the mode lies above it) and stop the
+    # lower tail once it flushes to 0
+    km = min(int((n+1) * p), k)
+    pk = math.exp(_log_pmf(km, n, p))
+    acc = pk
+    q = pk
+    for kk in range(km, 0, -1):
+        q = q * kk / (ratio * (n-kk+1))
+        acc = acc + q
+        if q == 0.0:
+            break
+    q = pk
+    for kk in range(km, k):
+        q = q * ratio * (n-kk) / (kk+1)
+        acc = acc + q
+    return min(acc, 1.0)
+
+
+@nb.njit(parallel=True, fastmath=True, cache=True)
+def oc_cdf(k:int, n:int, p_grid:np.ndarray)->np.ndarray:
+    """Binomial cdf at acceptance number k over a grid of p values.
+
+    Accumulates the pmf recurrence directly to index k without materializing
+    the full pmf array, giving the probability of acceptance for an OC curve.
+    The grid points are independent so the loop is parallelized across cores.
+
+    Args:
+        k (int): Acceptance number.
+        n (int): Sample size.
+        p_grid (np.ndarray): Lot probability defective values.
+
+    Returns:
+        np.ndarray: Probability of acceptance at each p in the grid.
+    """
+    y = np.empty(p_grid.size)
+    for i in nb.prange(p_grid.size):
+        y[i] = _binom_cdf_scalar(k, n, p_grid[i])
+    return y
+
+
+# Warm the JIT cache at import time so the first interactive event never stalls
+# on compilation; with cache=True the compiled binaries are reloaded from disk
+# on subsequent runs and this costs almost nothing
+_warm_grid = np.array([0.0, 0.5])
+pmf_array(2, 0.5)
+cdf_array(2, 0.5)
+pmf_at_k(1, 2, _warm_grid)
+oc_cdf(1, 2, _warm_grid)
+binom_truncated(2, 0.5, 1e-6)
+poisson_pmf_truncated(0.5, 2, 1e-6)
+del _warm_grid
@@ -1,17 +1,42 @@
-from scipy.stats import binom
+import functools
+
 import matplotlib.pyplot as plt
 import numpy as np
+from scipy.special import betainc
 from typing import List, Tuple
 
+import fast_binom as fb
+
+
+@functools.lru_cache(maxsize=16)
+def _pgrid(p_end:float, p_step:float)->np.ndarray:
+    """
+    Memoized p grid so repeated curve builds with the same range share one array.
+
+    Parameters
+    ----------
+    p_end : float
+        Max value for percent defective range.
+    p_step : float
+        Step size for percent defective range.
+
+    Returns
+    -------
+    np.ndarray
+        The p grid.
+
+    """
+
+    return np.arange(0.0, p_end, p_step)
 
 def binom_p(k:int, n:int, p_end:float=1.0, p_step:float=0.0005):
-    x = list(np.arange(0.0, p_end, p_step))
-    y = [binom.pmf(k,n,p) for p in x]
+    x = _pgrid(p_end, p_step)
+    y = fb.pmf_at_k(k, n, x)
     return x, y
 
 def binom_k(n:int, p:float):
-    x = list(range(0, n, 1))
-    y = [binom.pmf(k,n,p) for k in x]
+    x = np.arange(0, n, 1)
+    y = fb.pmf_array(n, p)[0:n]
     return x, y
 
 def get_area(x:List[float], y:List[float]):
@@ -30,22 +55,15 @@ def get_area(x:List[float], y:List[float]):
     area : TYPE
         x and y must contain the same number of elements
         x and y must have at least 2 elements
-        
+
 
     """
-    
-    area = 0.0
-    for i in range(0, len(x)-1):
-        xn = x[i]
-        xnn = x[i+1]
-        yn = y[i]
-        ynn = y[i+1]
-        
-        area = area + 0.5 * (xnn-xn) * (ynn+yn)
-        
-    return area
 
-def get_oc(k:int, n:int, p_end:float=0.20, p_step:float=0.01)->Tuple[List[float], List[float]]:
+    # Trapezoidal rule as one vectorized numpy call instead of a Python loop
+    return float(np.trapezoid(np.asarray(y), np.asarray(x)))
+
+@functools.lru_cache(maxsize=128)
+def get_oc(k:int, n:int, p_end:float=0.20, p_step:float=0.01)->Tuple[np.ndarray, np.ndarray]:
     """
     Generate operating characteristic curve data for a given sample size n.
 
@@ -62,19 +80,18 @@ def get_oc(k:int, n:int, p_end:float=0.20, p_step:float=0.01)->Tuple[List[float]
 
     Returns
     -------
-    (Tuple[List[float], List[float]])
+    (Tuple[np.ndarray, np.ndarray])
         Prob accept vs lot defectivity.
 
     """
-    
-    x = list(np.arange(0.0, p_end, p_step))
-    y = []
-    for pp in x:
-        # Cumulative sum of probability acceptance for fails <= acceptance number
-        p_accept_cum = 0.0
-        for kk in list(range(0,k+1)):
-            p_accept_cum = p_accept_cum + binom.pmf(kk, n, pp)
-        y.append(p_accept_cum)
+
+    x = _pgrid(p_end, p_step)
+    # binom.cdf(k, n, p) equals betainc(n-k, k+1, 1-p), so call the special-function
+    # primitive directly as one C ufunc pass over the grid with no distribution dispatch
+    if k >= n:
+        y = np.ones_like(x)
+    else:
+        y = betainc(n - k, k + 1, 1.0 - x)
     return x, y
     
 
@@ -95,15 +112,19 @@ def get_nearest_index(x:List[float], target:float)->int:
         The index of element closest to target.
 
     """
-    
-    d = {idx:abs(target-xx) for idx, xx in enumerate(x)}
-    return min(d, key=d.get)
+
+    # argmin of |x - target| in one vectorized pass instead of a boxed Python dict scan
+    return int(np.abs(np.asarray(x) - target).argmin())
 
 def get_envelope(x:List[float], target:float)->Tuple[int, int]:
-    
-    d = [(idx, abs(target-xx)) for idx, xx in enumerate(x)]
-    d.sort(key = lambda xx: xx[1])
-    return d[0][0], d[1][0]
+
+    # Top-2 of the absolute difference via an O(n) partition instead of a full sort
+    d = np.abs(np.asarray(x) - target)
+    idx = np.argpartition(d, 1)[0:2]
+    # Keep the closest-first ordering of the old sorted version
+    if d[idx[0]] > d[idx[1]]:
+        return int(idx[1]), int(idx[0])
+    return int(idx[0]), int(idx[1])
 
 def get_ql(k:float, n:float, pval:float)->float:
     """
@@ -143,6 +164,11 @@ class oc_curve:
         self.make_data()
     
     def make_data(self, p_end:float=0.20, p_step:float=0.001):
+        # Skip the recompute entirely when the sample plan and grid are unchanged
+        cache_key = (self.n_accept, self.sample_size, p_end, p_step)
+        if getattr(self, "_cache_key", None) == cache_key:
+            return
+        self._cache_key = cache_key
         self.x_data, self.y_data = get_oc(self.n_accept, self.sample_size, p_end, p_step)
         
     def update_curve(self, sample_size:int, acceptance_number:int, p_end:float=0.20, p_step:float=0.02):
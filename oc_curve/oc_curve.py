@@ -1,8 +1,32 @@
-from scipy.stats import binom
+import functools
+
 import numpy as np
+from scipy.special import betainc
 from typing import List, Tuple
 
-def get_oc(k:int, n:int, p_end:float=0.20, p_step:float=0.01)->Tuple[List[float], List[float]]:
+@functools.lru_cache(maxsize=16)
+def _pgrid(p_end:float, p_step:float)->np.ndarray:
+    """
+    Memoized p grid so repeated curve builds with the same range share one array.
+
+    Parameters
+    ----------
+    p_end : float
+        Max value for percent defective range.
+    p_step : float
+        Step size for percent defective range.
+
+    Returns
+    -------
+    np.ndarray
+        The p grid.
+
+    """
+
+    return np.arange(0.0, p_end, p_step)
+
+@functools.lru_cache(maxsize=128)
+def get_oc(k:int, n:int, p_end:float=0.20, p_step:float=0.01)->Tuple[np.ndarray, np.ndarray]:
     """
     Generate operating characteristic curve data for a given sample size n.
 
@@ -19,19 +43,18 @@ def get_oc(k:int, n:int, p_end:float=0.20, p_step:float=0.01)->Tuple[List[float]
 
     Returns
     -------
-    (Tuple[List[float], List[float]])
+    (Tuple[np.ndarray, np.ndarray])
         Prob accept vs lot defectivity.
 
     """
-    
-    x = list(np.arange(0.0, p_end, p_step))
-    y = []
-    for pp in x:
-        # Cumulative sum of probability acceptance for fails <= acceptance number
-        p_accept_cum = 0.0
-        for kk in list(range(0,k+1)):
-            p_accept_cum = p_accept_cum + binom.pmf(kk, n, pp)
-        y.append(p_accept_cum)
+
+    x = _pgrid(p_end, p_step)
+    # binom.cdf(k, n, p) equals betainc(n-k, k+1, 1-p), so call the special-function
+    # primitive directly as one C ufunc pass over the grid with no distribution dispatch
+    if k >= n:
+        y = np.ones_like(x)
+    else:
+        y = betainc(n - k, k + 1, 1.0 - x)
     return x, y
     
 def get_envelope(x:List[float], target:float)->Tuple[int, int]:
@@ -51,10 +74,14 @@ def get_envelope(x:List[float], target:float)->Tuple[int, int]:
         Left and right data values which envelope the target.
 
     """
-    
-    d = [(idx, abs(target-xx)) for idx, xx in enumerate(x)]
-    d.sort(key = lambda xx: xx[1])
-    return d[0][0], d[1][0]
+
+    # Top-2 of the absolute difference via an O(n) partition instead of a full sort
+    d = np.abs(np.asarray(x) - target)
+    idx = np.argpartition(d, 1)[0:2]
+    # Keep the closest-first ordering of the old sorted version
+    if d[idx[0]] > d[idx[1]]:
+        return int(idx[1]), int(idx[0])
+    return int(idx[0]), int(idx[1])
 
 class oc_curve:
     def __init__(self, sample_size:int = 300, acceptance_number:int= 3, alpha:float = 0.05, beta:float = 0.10)->None:
@@ -101,6 +128,11 @@ class oc_curve:
             DESCRIPTION.
 
         """
+        # Skip the recompute entirely when the sample plan and grid are unchanged
+        cache_key = (self.n_accept, self.sample_size, p_end, p_step)
+        if getattr(self, "_cache_key", None) == cache_key:
+            return
+        self._cache_key = cache_key
         self.x_data, self.y_data = get_oc(self.n_accept, self.sample_size, p_end, p_step)
         
     def update_curve(self, sample_size:int, acceptance_number:int, p_end:float=0.20, p_step:float=0.02)->None:
@@ -8,10 +8,9 @@ Created on Tue Dec 13 02:38:54 2022
 @author: kzhuo
 """
 
-import sys
-
-from oc_curve import get_envelope, oc_curve
+from oc_curve import oc_curve
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib.widgets import Slider, Button, TextBox
 from typing import Final, List, Tuple, Union
 
@@ -115,6 +114,12 @@ class oc_plotter:
         # Set the main x and y data
         self.x_data = x_data
         self.y_data = y_data
+        # Contiguous array views for the np.interp lookups in the update handlers,
+        # with the reversed copies built once here instead of per event
+        self._x_arr = np.asarray(x_data)
+        self._y_arr = np.asarray(y_data)
+        self._x_rev = np.ascontiguousarray(self._x_arr[::-1])
+        self._y_rev = np.ascontiguousarray(self._y_arr[::-1])
 
         # Default plot settings and definitions
         self.fig, self.ax = plt.subplots()
@@ -133,9 +138,28 @@ class oc_plotter:
         # Define these placeholders with dummy values to enable update at end
         self.aql_pt, = self.ax.plot([0.0, 0.0],[0.0, 0.0], marker='o', color='g', markersize=8) # The aql point object (as a line)
         self.rql_pt, = self.ax.plot([0.0, 0.0],[0.0, 0.0], marker='o', color='r', markersize=8) # The rql point object (as a line)
-        self.aql_anno = self.ax.annotate("AQL", (0.0, 0.0)) # The aql point annotation
-        self.rql_anno = self.ax.annotate("RQL", (0.0, 0.0)) # The rql point annotation
-        
+        # Create the annotations once with their final styling; updates just move them
+        self.aql_anno = self.ax.annotate("-> AQL", (0.0, 0.0), weight='bold', fontsize=12) # The aql point annotation
+        self.rql_anno = self.ax.annotate("-> RQL", (0.0, 0.0), weight='bold', fontsize=12) # The rql point annotation
+
+        # Set up blitting so interactive updates repaint only the data artists
+        self._bg = None
+        for a in self.animated_artists():
+            a.set_animated(True) # Exclude from full redraws so the background snapshot is static
+        self.fig.canvas.mpl_connect('draw_event', self.on_draw)
+
+        # Throttle timers so fast slider drags coalesce into one redraw per interval
+        self._ylim_timer = self.fig.canvas.new_timer(interval=30)
+        self._ylim_timer.single_shot = True
+        self._ylim_timer.add_callback(self.apply_ylim)
+        self._xlim_timer = self.fig.canvas.new_timer(interval=30)
+        self._xlim_timer.single_shot = True
+        self._xlim_timer.add_callback(self.apply_xlim)
+
+        # Re-entrancy guard so a programmatic set_val on one textbox does not
+        # fire its submit handler and loop back into the caller
+        self._updating = False
+
         # Make axes sliders
         self.make_ylim_slider()
         self.make_xlim_slider()
@@ -155,8 +179,41 @@ class oc_plotter:
         self.make_rql_tbox()
         # UPdate Beta and RQL to default values
         self.beta_update(BETA)
-        
+
         print("OC plotter initiated")
+
+    def animated_artists(self)->List:
+        """The artists repainted by the blit fast path.
+
+        Returns:
+            List: OC line, AQL/RQL points and their annotations.
+        """
+        return [self.line, self.aql_pt, self.rql_pt, self.aql_anno, self.rql_anno]
+
+    def on_draw(self, event)->None:
+        """Recapture the static background and repaint the data artists after any full redraw.
+
+        Connected to draw_event so slider-driven limit changes and resizes keep
+        the cached background in sync with the canvas.
+
+        Args:
+            event: Matplotlib draw event.
+        """
+        self._bg = self.fig.canvas.copy_from_bbox(self.ax.bbox)
+        for a in self.animated_artists():
+            self.ax.draw_artist(a)
+
+    def blit_artists(self)->None:
+        """Repaint only the data artists over the cached background and blit.
+        """
+        if self._bg is None:
+            # No full draw has happened yet, nothing to blit onto
+            return
+        self.fig.canvas.restore_region(self._bg)
+        for a in self.animated_artists():
+            self.ax.draw_artist(a)
+        self.fig.canvas.blit(self.ax.bbox)
+        self.fig.canvas.flush_events()
         
     def set_limit(self, val:float, min:float = 0.0, max:float = 1.0)->float:
         """Utility function to limit value between min and max.
@@ -196,10 +253,18 @@ class oc_plotter:
         
         self.x_data = x_data
         self.y_data = y_data
-        self.line.set_ydata(y_data)
-        self.line.set_xdata(x_data)
-        self.ax.relim()
-        self.fig.canvas.draw() # This is needed to force the plot to refresh or there will be some delay
+        # Convert to ndarray once here; set_data then hands matplotlib arrays directly
+        # and invalidates the line path once instead of twice
+        self._x_arr = np.asarray(x_data)
+        self._y_arr = np.asarray(y_data)
+        self._x_rev = np.ascontiguousarray(self._x_arr[::-1])
+        self._y_rev = np.ascontiguousarray(self._y_arr[::-1])
+        self.line.set_data(self._x_arr, self._y_arr)
+        # Axis limits are fixed by the sliders, so only recompute data limits
+        # in the unusual case that autoscaling has been turned on
+        if self.ax.get_autoscale_on():
+            self.ax.relim()
+        self.blit_artists() # Repaint only the data artists over the cached background
         print("Plot data updated")
         
         # Update the Alpha and Beta (along with AQL and RQL implicitly)
@@ -207,32 +272,6 @@ class oc_plotter:
         self.beta_update(self.beta_tbox.text)
         
         
-    def get_line(self, idx_l:int, idx_r:int)->Tuple[float, float]:
-        """
-        Calculate gradient and y-intercept between 2 points of data.
-
-        Parameters
-        ----------
-        idx_l : int
-            The left data point index.
-        idx_r : int
-            The right data point index.
-
-        Returns
-        -------
-        Tuple[float, float]
-            Tuple of gradient and y-intercept.
-
-        """
-        
-        xl = self.x_data[idx_l]
-        xr = self.x_data[idx_r]
-        yl = self.y_data[idx_l]
-        yr = self.y_data[idx_r]
-        m = (yr-yl) / (xr-xl) # Gradient
-        c = yl - m*xl # y-intercept
-        return m, c
-    
     def update_aql_pt(self, x_target:float, y_target:float)->None:
         """
         Update the AQL point and annotation.
@@ -252,10 +291,10 @@ class oc_plotter:
         
         self.aql_pt.set_xdata([x_target])
         self.aql_pt.set_ydata([y_target])
-        self.aql_anno.remove()
-        self.aql_anno = self.ax.annotate("-> AQL", (x_target, y_target), weight='bold', fontsize=12)
-        self.ax.relim()
-        self.fig.canvas.draw() # This is needed to force the plot to refresh or there will be some delay
+        # Move the existing Text artist instead of destroying and recreating it
+        self.aql_anno.xy = (x_target, y_target)
+        self.aql_anno.set_position((x_target, y_target))
+        self.blit_artists() # Repaint only the data artists over the cached background
     
     def update_rql_pt(self, x_target:float, y_target:float)->None:
         """
@@ -276,10 +315,10 @@ class oc_plotter:
         
         self.rql_pt.set_xdata([x_target])
         self.rql_pt.set_ydata([y_target])
-        self.rql_anno.remove()
-        self.rql_anno = self.ax.annotate("-> RQL", (x_target, y_target), weight='bold', fontsize=12)
-        self.ax.relim()
-        self.fig.canvas.draw() # This is needed to force the plot to refresh or there will be some delay
+        # Move the existing Text artist instead of destroying and recreating it
+        self.rql_anno.xy = (x_target, y_target)
+        self.rql_anno.set_position((x_target, y_target))
+        self.blit_artists() # Repaint only the data artists over the cached background
 
     #%% ylim slider
     def make_ylim_slider(self)->None:
@@ -304,9 +343,21 @@ class oc_plotter:
         self.ylim_slider.on_changed(self.ylim_update)
     
     def ylim_update(self, val):
+        # Restart the throttle timer; only the last value inside the window is applied
+        self._ylim_timer.stop()
+        self._ylim_timer.start()
+
+    def apply_ylim(self)->None:
+        """
+        Apply the latest y range slider value and request a redraw.
+
+        Returns
+        -------
+        None
+        """
         self.ax.set_ylim(0.0, self.ylim_slider.val)
         self.fig.canvas.draw_idle()
-        
+
     #%% xlim slider
     def make_xlim_slider(self)->None:
         """
@@ -342,6 +393,18 @@ class oc_plotter:
         -------
         None
 
+        """
+        # Restart the throttle timer; only the last value inside the window is applied
+        self._xlim_timer.stop()
+        self._xlim_timer.start()
+
+    def apply_xlim(self)->None:
+        """
+        Apply the latest x range slider value and request a redraw.
+
+        Returns
+        -------
+        None
         """
         self.ax.set_xlim(0.0, self.xlim_slider.val)
         self.fig.canvas.draw_idle()
@@ -390,7 +453,7 @@ class oc_plotter:
         alpha_tbox_ax = self.fig.add_axes([0.4, 0.05, 0.075, 0.05])
         self.alpha_tbox = TextBox(alpha_tbox_ax, "Alpha", textalignment="left")
         self.alpha_tbox.set_val(f"{ALPHA}")
-        self.alpha_tbox_cid = self.alpha_tbox.on_submit(self.alpha_update) # Note cid to connect/disconnect events
+        self.alpha_tbox.on_submit(self.alpha_update)
         
     @check_float(0.0, 1.0)
     def alpha_update(self, val:Union[str,float])->None:
@@ -407,13 +470,15 @@ class oc_plotter:
         None
         """
         
+        if self._updating:
+            return # Programmatic cross-update, nothing to do
+
         # Use linear interpolation to find AQL target corresponding to given Alpha target
+        # y decreases along the OC curve, so interpolate over the reversed arrays
         y_target = 1.0 - float(val)
         print(f"New Alpha {y_target}")
-        idx_l, idx_r = get_envelope(self.y_data, y_target)
-        m, c = self.get_line(idx_l, idx_r)
-        x_target = (y_target - c) / m
-        
+        x_target = float(np.interp(y_target, self._y_rev, self._x_rev))
+
         # Update the AQL textbox
         self.set_aql_tbox(x_target)
         # Update the Aql point
@@ -425,9 +490,11 @@ class oc_plotter:
         Args:
             val (float): Update value.
         """
-        self.alpha_tbox.disconnect(self.alpha_tbox_cid) # Disconnect update event
-        self.alpha_tbox.set_val("{0:.3f}".format(val))
-        self.alpha_tbox_cid = self.alpha_tbox.on_submit(self.alpha_update) # Reconnect update event
+        self._updating = True # Suppress the submit handler triggered by set_val
+        try:
+            self.alpha_tbox.set_val("{0:.3f}".format(val))
+        finally:
+            self._updating = False
 
     #%% AQL
     def make_aql_tbox(self)->None:
@@ -442,7 +509,7 @@ class oc_plotter:
         """
         aql_tbox_ax = self.fig.add_axes([0.53, 0.05, 0.075, 0.05])
         self.aql_tbox = TextBox(aql_tbox_ax, "AQL", textalignment="left")
-        self.aql_tbox_cid = self.aql_tbox.on_submit(self.aql_update) # Note cid to connect/disconnect events
+        self.aql_tbox.on_submit(self.aql_update)
         
     @check_float(0.0, 1.0)
     def aql_update(self, val:str)->None:
@@ -460,13 +527,14 @@ class oc_plotter:
             DESCRIPTION.
 
         """
+        if self._updating:
+            return # Programmatic cross-update, nothing to do
+
         # Use linear interpolation to find Alpha target corresponding to given AQL target
         x_target = float(val)
         print(f"New AQL {x_target}")
-        idx_l, idx_r = get_envelope(self.x_data, x_target)
-        m, c = self.get_line(idx_l, idx_r)
-        y_target = m * x_target + c
-        
+        y_target = float(np.interp(x_target, self._x_arr, self._y_arr))
+
         # Update the Alpha textbox
         self.set_alpha_tbox(1.0-y_target)
         # Update the Aql point
@@ -478,9 +546,11 @@ class oc_plotter:
         Args:
             val (float): Value to update the Aql textbox text.
         """
-        self.aql_tbox.disconnect(self.aql_tbox_cid) # Disconnect update event
-        self.aql_tbox.set_val("{0:.3f}".format(val))
-        self.aql_tbox_cid = self.aql_tbox.on_submit(self.aql_update) # Reconnect update event
+        self._updating = True # Suppress the submit handler triggered by set_val
+        try:
+            self.aql_tbox.set_val("{0:.3f}".format(val))
+        finally:
+            self._updating = False
 
     #%% Beta
     def make_beta_tbox(self)->None:
@@ -496,7 +566,7 @@ class oc_plotter:
         beta_tbox_ax = self.fig.add_axes([0.7, 0.05, 0.075, 0.05])
         self.beta_tbox = TextBox(beta_tbox_ax, "Beta", textalignment="left")
         self.beta_tbox.set_val(f"{BETA}")
-        self.beta_tbox_cid = self.beta_tbox.on_submit(self.beta_update)
+        self.beta_tbox.on_submit(self.beta_update)
     
     @check_float(0.0, 1.0)
     def beta_update(self, val:str)->None:
@@ -513,13 +583,15 @@ class oc_plotter:
         None
         """
         
+        if self._updating:
+            return # Programmatic cross-update, nothing to do
+
         # Use linear interpolation to find rql target corresponding to given beta target
+        # y decreases along the OC curve, so interpolate over the reversed arrays
         y_target = float(val)
         print(f"New beta {y_target}")
-        idx_l, idx_r = get_envelope(self.y_data, y_target)
-        m, c = self.get_line(idx_l, idx_r)
-        x_target = (y_target - c) / m
-        
+        x_target = float(np.interp(y_target, self._y_rev, self._x_rev))
+
         # Update the rql textbox
         self.set_rql_tbox(x_target)
         # Update the rql pt
@@ -531,9 +603,11 @@ class oc_plotter:
         Args:
             val (float): Value to set.
         """
-        self.beta_tbox.disconnect(self.beta_tbox_cid) # Disconnect update event
-        self.beta_tbox.set_val("{0:.3f}".format(val))
-        self.beta_tbox_cid = self.beta_tbox.on_submit(self.beta_update) # Reconnect update event
+        self._updating = True # Suppress the submit handler triggered by set_val
+        try:
+            self.beta_tbox.set_val("{0:.3f}".format(val))
+        finally:
+            self._updating = False
 
     #%% RQL
     def make_rql_tbox(self):
@@ -547,7 +621,7 @@ class oc_plotter:
         """
         rql_tbox_ax = self.fig.add_axes([0.83, 0.05, 0.075, 0.05])
         self.rql_tbox = TextBox(rql_tbox_ax, "RQL", textalignment="left")
-        self.rql_tbox_cid = self.rql_tbox.on_submit(self.rql_update)
+        self.rql_tbox.on_submit(self.rql_update)
         
     @check_float(0.0, 1.0)
     def rql_update(self, val:str)->None:
@@ -565,12 +639,13 @@ class oc_plotter:
             DESCRIPTION.
 
         """
+        if self._updating:
+            return # Programmatic cross-update, nothing to do
+
         x_target = float(val)
         print(f"New rql {x_target}")
-        idx_l, idx_r = get_envelope(self.x_data, x_target)
-        m, c = self.get_line(idx_l, idx_r)
-        y_target = m * x_target + c
-        
+        y_target = float(np.interp(x_target, self._x_arr, self._y_arr))
+
         # Update the Beta textbox
         self.set_beta_tbox(y_target)
         # Update the Rql pt
@@ -582,9 +657,11 @@ class oc_plotter:
         Args:
             val (float): Value to set.
         """
-        self.rql_tbox.disconnect(self.rql_tbox_cid) # Disconnect update event
-        self.rql_tbox.set_val("{0:.3f}".format(val))
-        self.rql_tbox_cid = self.rql_tbox.on_submit(self.rql_update) # Reconnect update event
+        self._updating = True # Suppress the submit handler triggered by set_val
+        try:
+            self.rql_tbox.set_val("{0:.3f}".format(val))
+        finally:
+            self._updating = False
         
 if __name__ == "__main__":
     # Set the matplotlib plotting backend
@@ -2,6 +2,8 @@
 """
 import math
 
+import numpy as np
+
 def pdf(t:float, m:float=1.0, c:float=1.0)-> float:
     """Weibull probability distribution function.
 
@@ -14,7 +16,7 @@ def pdf(t:float, m:float=1.0, c:float=1.0)-> float:
         float: result
     """
     p = - pow(t/c, m)
-    return m/t * pow(t/c, m) * pow(math.e, p)
+    return m/t * pow(t/c, m) * math.exp(p)
 
 def cdf(t:float, m:float=1.0, c:float=1.0)-> float:
     """Weibull cumulative distribution function.
@@ -28,7 +30,7 @@ def cdf(t:float, m:float=1.0, c:float=1.0)-> float:
         float: result
     """
     p = - pow(t/c, m)
-    return 1.0-pow(math.e, p)
+    return -math.expm1(p) # Stable where exp(p) is within rounding of 1
 
 def hazard(t:float, m:float=1.0, c:float=1.0)-> float:
     """Weibull hazard function aka failure rate.
@@ -42,3 +44,22 @@ def hazard(t:float, m:float=1.0, c:float=1.0)-> float:
         float: result
     """
     return m/t * pow(t/c, m)
+
+def pdf_cdf_hazard(t, m:float=1.0, c:float=1.0):
+    """Fused evaluation of the Weibull cdf, pdf and hazard.
+
+    Computes (t/c)**m and its exp once and derives all three functions from
+    the shared terms, instead of recomputing them per function.
+
+    Args:
+        t: variable, a float or np.ndarray
+        m (float): shape parameter
+        c (float): scale parameter aka characteristic life
+
+    Returns:
+        tuple: (cdf, pdf, hazard) results
+    """
+    r = np.power(t/c, m)
+    em1 = np.expm1(-r)
+    hr = (m/t) * r
+    return -em1, hr*(em1+1.0), hr
@@ -1,12 +1,46 @@
 """Generate plots for Weibull functions.
 """
+import logging
+import math
+import os
+
 import matplotlib
+# Pick the backend before pyplot initializes one, so the default GUI shim is
+# never loaded and then torn down; MPLBACKEND still wins for headless runs
+if "MPLBACKEND" not in os.environ:
+    matplotlib.use("Qt5Agg") # macosx backend is buggy for textbox widget. qt5 seems decent.
 import matplotlib.pyplot as plt
 from matplotlib.widgets import TextBox
 from typing import Final, Union
 import numpy as np
 import weibull as wb
 
+try:
+    import weibull_numba as wnb
+except ImportError:
+    wnb = None # Optional JIT path; reset_model falls back to the numpy version
+
+log = logging.getLogger(__name__)
+
+def _pdf_max(m:float, c:float, t_start:float)->float:
+    """Analytic maximum of the Weibull pdf over [t_start, inf).
+
+    For m > 1 the pdf peaks at the mode with a closed-form value; for m <= 1
+    it is decreasing, so the left boundary point is the maximum.
+
+    Args:
+        m (float): Shape parameter.
+        c (float): Scale parameter.
+        t_start (float): Horizontal axis start value.
+
+    Returns:
+        float: Maximum pdf value.
+    """
+    if m > 1.0:
+        q = (m - 1.0) / m
+        return m / c * q**q * math.exp(-q)
+    return wb.pdf(t_start, m, c)
+
 # Plot position default settings
 LEFT:Final[float] = 0.1
 TOP:Final[float] = 0.75
@@ -25,7 +59,7 @@ T_END:Final[float] = 2.0
 class weibull_model:
     """Class to generate Weibull statistics data for given parameters.
     """
-    def __init__(self, m:float = SHAPE_PARAMETER, c:float = SCALE_PARAMETER, t_count:int = SAMPLE_SIZE, t_start:float = T_START, t_end:float = T_END) -> None:
+    def __init__(self, m:float = SHAPE_PARAMETER, c:float = SCALE_PARAMETER, t_count:int = SAMPLE_SIZE, t_start:float = T_START, t_end:float = T_END, dtype:type = np.float32) -> None:
         """Constructor requiring shape and scale parameters to generate Weibull model data.
 
         Args:
@@ -34,14 +68,52 @@ class weibull_model:
             t_count (int, optional): No. of points for horizontal axis data.
             t_start (float, optional): Horizontal axis start value.
             t_end (float, optional): Horizontal axis end value.
+            dtype (type, optional): Array dtype. float32 is ample for display
+                data and halves memory traffic; pass np.float64 for
+                accuracy-critical use.
         """
         self.m = m
         self.c = c
-        
-        self.t_data = list(np.linspace(t_start, t_end, t_count)) # Generate horizontal axis data
+        self.dtype = np.dtype(dtype)
+
+        self.t_data = np.linspace(t_start, t_end, t_count, dtype=self.dtype) # Generate horizontal axis data
 
+        self.make_buffers() # Preallocate output buffers reused across updates
+        self.make_tables() # Cache tables reused across shape parameter updates
         self.reset_model() # Generate model data
 
+        if wnb is not None:
+            # Warm the JIT cache with a two-element array so the first
+            # interactive m edit never stalls on compilation; the closed-form
+            # m=1/m=2 branches skip the kernel, so reset_model alone may not
+            # have compiled it. With cache=True reruns load the binary from disk.
+            warm_t = np.array([self.t_data[0], self.t_data[-1]], dtype=self.dtype)
+            wnb.fill_all(warm_t, self.m, self.c,
+                         np.empty(2, dtype=self.dtype),
+                         np.empty(2, dtype=self.dtype),
+                         np.empty(2, dtype=self.dtype))
+
+    def make_buffers(self)->None:
+        """Preallocate the vertical axes buffers.
+
+        reset_model fills these in place, so parameter updates allocate nothing.
+        """
+        self.cdf_data = np.empty(len(self.t_data), dtype=self.dtype)
+        self.pdf_data = np.empty(len(self.t_data), dtype=self.dtype)
+        self.h_data = np.empty(len(self.t_data), dtype=self.dtype)
+        # Scratch buffers for the intermediate power and exp terms
+        self._r = np.empty(len(self.t_data), dtype=self.dtype)
+        self._e = np.empty(len(self.t_data), dtype=self.dtype)
+
+    def make_tables(self)->None:
+        """Cache tables that depend only on t_data and c.
+
+        An m update leaves these unchanged, so hoisting them out of reset_model
+        means only the exp calls remain on the interactive hot path.
+        """
+        self._inv_t = 1.0 / self.t_data
+        self._log_tc = np.log(self.t_data / self.c)
+
     def update_m(self, m:float)->None:
         """Update the shape parameter.
 
@@ -51,17 +123,73 @@ class weibull_model:
         self.m = m
         self.reset_model() # Refresh model data
 
+    def update_c(self, c:float)->None:
+        """Update the scale parameter.
+
+        Args:
+            c (float): Value to update.
+        """
+        self.c = c
+        self.make_tables() # The cached tables depend on c
+        self.reset_model() # Refresh model data
+
+    def update_t_data(self, t_start:float, t_end:float, t_count:int)->None:
+        """Update the horizontal axis data.
+
+        Args:
+            t_start (float): Horizontal axis start value.
+            t_end (float): Horizontal axis end value.
+            t_count (int): No. of points for horizontal axis data.
+        """
+        self.t_data = np.linspace(t_start, t_end, t_count, dtype=self.dtype)
+        self.make_buffers() # The buffer length depends on t_data
+        self.make_tables() # The cached tables depend on t_data
+        self.reset_model() # Refresh model data
+
     def reset_model(self)->None:
         """Regenerate vertical axes data.
         """
-        self.cdf_data = list()
-        self.pdf_data = list()
-        self.h_data = list()
-        # Use existing Weibull model parameters to regenerate vertical axis data
-        for t in self.t_data:
-            self.cdf_data.append(wb.cdf(t, self.m, self.c))
-            self.pdf_data.append(wb.pdf(t, self.m, self.c))
-            self.h_data.append(wb.hazard(t, self.m, self.c))
+        if self.m == 1.0:
+            # Exponential closed form: constant hazard and no pow at all
+            np.divide(self.t_data, -self.c, out=self._e)
+            np.expm1(self._e, out=self._e)
+            np.negative(self._e, out=self.cdf_data)
+            self._e += 1.0
+            np.divide(self._e, self.c, out=self.pdf_data)
+            self.h_data.fill(1.0 / self.c)
+            return
+        if self.m == 2.0:
+            # Rayleigh closed form: u**(m-1) is just u
+            np.divide(self.t_data, self.c, out=self._r)
+            np.multiply(self._r, 2.0 / self.c, out=self.h_data)
+            np.multiply(self._r, self._r, out=self._r)
+            np.negative(self._r, out=self._e)
+            np.expm1(self._e, out=self._e)
+            np.negative(self._e, out=self.cdf_data)
+            self._e += 1.0
+            np.multiply(self.h_data, self._e, out=self.pdf_data)
+            return
+
+        if wnb is not None:
+            # One parallel compiled pass fills all three buffers in place
+            wnb.fill_all(self.t_data, self.m, self.c, self.cdf_data, self.pdf_data, self.h_data)
+            return
+
+        # (t/c)**m evaluated as exp(m * log(t/c)) over the cached log table, so a
+        # shape parameter update costs two exp passes instead of a general pow.
+        # Every ufunc writes into a preallocated buffer, so the hot path does
+        # no array allocation at all.
+        np.multiply(self.m, self._log_tc, out=self._r)
+        np.exp(self._r, out=self._r)
+        # expm1 keeps the cdf accurate where exp(-r) is within rounding of 1;
+        # the survival term for the pdf is recovered from it without a second exp
+        np.negative(self._r, out=self._e)
+        np.expm1(self._e, out=self._e)
+        np.negative(self._e, out=self.cdf_data)
+        self._e += 1.0
+        np.multiply(self._inv_t, self._r, out=self.h_data)
+        self.h_data *= self.m
+        np.multiply(self.h_data, self._e, out=self.pdf_data)
 
 class weibull_plot:
     """Class to generate Weibull plots for given Weibull model.
@@ -111,7 +239,45 @@ class weibull_plot:
         # Make textbox for notes
         self.make_note_txt()
 
-        print("Weibull plotter initiated")
+        # Set up blitting so interactive updates repaint only the lines
+        self._blit_pairs = [(self.ax0, self.cdf_line), (self.ax1, self.pdf_line), (self.ax2, self.h_line)]
+        self._bg = None
+        for ax, line in self._blit_pairs:
+            line.set_animated(True) # Exclude the lines from full redraws so the background snapshot is static
+        self.fig.canvas.mpl_connect('draw_event', self.on_draw)
+
+        # Debounce timer coalescing bursts of shape parameter submits into one refresh
+        self._pending_m = None
+        self._debounce = self.fig.canvas.new_timer(interval=40)
+        self._debounce.single_shot = True
+        self._debounce.add_callback(self._apply_pending_m)
+
+        log.info("Weibull plotter initiated")
+
+    def on_draw(self, event)->None:
+        """Recapture the static backgrounds and repaint the lines after any full redraw.
+
+        Connected to draw_event so resizes and deferred redraws keep the cached
+        backgrounds in sync with the canvas.
+
+        Args:
+            event: Matplotlib draw event.
+        """
+        self._bg = {ax: self.fig.canvas.copy_from_bbox(ax.bbox) for ax, _ in self._blit_pairs}
+        for ax, line in self._blit_pairs:
+            ax.draw_artist(line)
+
+    def blit_lines(self)->None:
+        """Repaint only the line artists over the cached backgrounds and blit.
+        """
+        if self._bg is None:
+            # No full draw has happened yet, nothing to blit onto
+            return
+        for ax, line in self._blit_pairs:
+            self.fig.canvas.restore_region(self._bg[ax])
+            ax.draw_artist(line)
+            self.fig.canvas.blit(ax.bbox)
+        self.fig.canvas.flush_events()
 
     def make_note_txt(self)->None:
         """Method to create non-interactive text box for notes.
@@ -138,13 +304,43 @@ class weibull_plot:
         try:
             m = float(val)
         except ValueError:
-            print("Invalid shape parameter")
+            log.warning("Invalid shape parameter")
             return
         
-        print(f"New shape parameter m {m}")
+        if m == self.model.m:
+            # Unchanged value (e.g. Enter without editing): cancel any pending
+            # recompute instead of rebuilding identical data
+            self._pending_m = None
+            self._debounce.stop()
+            return
+
+        log.debug("New shape parameter m %s", m)
+        # Stash the value and restart the timer; only the newest submit within
+        # the debounce window triggers a recompute
+        self._pending_m = m
+        self._debounce.stop()
+        self._debounce.start()
+
+    def _apply_pending_m(self)->None:
+        """Debounce timer callback applying the newest pending shape parameter.
+        """
+        m = self._pending_m
+        if m is None:
+            return
+        self._pending_m = None
         self.model.update_m(m)
         self.update_data()
 
+    def update_xdata(self)->None:
+        """Method to push a regenerated horizontal axis onto the lines.
+
+        Parameter updates leave t_data untouched, so update_data never pushes
+        x; call this only after model.update_t_data.
+        """
+        self.cdf_line.set_xdata(self.model.t_data)
+        self.pdf_line.set_xdata(self.model.t_data)
+        self.h_line.set_xdata(self.model.t_data)
+
     def update_data(self)->None:
         """Method to refresh model data.
         """
@@ -152,26 +348,32 @@ class weibull_plot:
         self.pdf_line.set_ydata(self.model.pdf_data)
         self.h_line.set_ydata(self.model.h_data)
 
-        self.cdf_line.set_xdata(self.model.t_data)        
-        self.pdf_line.set_xdata(self.model.t_data)        
-        self.h_line.set_xdata(self.model.t_data)
-
-        # Rescale the axes where scaling is set to auto
-        for x in [self.ax0, self.ax1, self.ax2]:
-            x.relim()
-            x.autoscale_view()
-        
-        self.fig.canvas.draw() # This is needed to force the plot to refresh or there will be some delay
+        # The cdf axis top is fixed at 1; the pdf maximum has a closed form and
+        # the hazard is monotone, so both remaining tops come from analytic
+        # values instead of a relim scan over every datapoint. Limits only move
+        # when the data has clearly outgrown (or shrunk well below) them, since
+        # a limit change invalidates the cached blit backgrounds
+        pdf_max = _pdf_max(self.model.m, self.model.c, float(self.model.t_data[0]))
+        h_max = max(float(self.model.h_data[0]), float(self.model.h_data[-1]))
+        redraw = False
+        for ax, data_max in ((self.ax1, pdf_max), (self.ax2, h_max)):
+            top = ax.get_ylim()[1]
+            if data_max > top or data_max < 0.2 * top:
+                ax.set_ylim(0.0, 1.05 * data_max)
+                redraw = True
+        if redraw:
+            # Deferred full redraw; bursts of events coalesce into one paint
+            # and on_draw recaptures the backgrounds when it runs
+            self.fig.canvas.draw_idle()
+        else:
+            self.blit_lines() # Fast path repaints just the three lines
 
 if __name__ == "__main__":
     """Main entry point into Weibull plotter.
     """
-    # Set the matplotlib plotting backend
-    backend = matplotlib.get_backend()
-    if backend != 'Qt5Agg':
-        matplotlib.use("Qt5Agg") # macosx backend is buggy for textbox widget. qt5 seems decent.
-    print(f"Using backend {matplotlib.get_backend()}")
-    
+    logging.basicConfig(level=logging.INFO)
+    log.info("Using backend %s", matplotlib.get_backend())
+
     mm = weibull_model() # Create Weibull model
     pp = weibull_plot(mm) # Pass model into plotter
     
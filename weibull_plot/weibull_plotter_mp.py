@@ -0,0 +1,104 @@
+"""Multiprocessing variant of the Weibull plotter.
+
+The model, plot and its GUI event loop live in a worker process; the main
+process holds only the shape parameter textbox and enqueues each submitted m.
+A slow redraw therefore can never back up the input event queue, and stale
+values are dropped so the worker only ever renders the newest m.
+"""
+import multiprocessing as mp
+import queue
+
+import matplotlib
+import matplotlib.pyplot as plt
+from matplotlib.widgets import TextBox
+from typing import Final, Union
+
+# Worker queue poll interval in milliseconds
+POLL_INTERVAL:Final[int] = 50
+
+def plot_worker(q:mp.Queue)->None:
+    """Worker process target owning the Weibull model, plot and GUI loop.
+
+    Args:
+        q (mp.Queue): Queue of shape parameter values from the main process.
+    """
+    from weibull_plotter import weibull_model, weibull_plot
+
+    mm = weibull_model() # Create Weibull model
+    pp = weibull_plot(mm) # Pass model into plotter
+
+    def poll()->None:
+        """Drain the queue keeping only the newest m, then refresh once.
+        """
+        m = None
+        while True:
+            try:
+                m = q.get_nowait()
+            except queue.Empty:
+                break
+        if m is not None:
+            mm.update_m(m)
+            pp.update_data()
+
+    timer = pp.fig.canvas.new_timer(interval=POLL_INTERVAL)
+    timer.add_callback(poll)
+    timer.start()
+    plt.show()
+
+class m_control:
+    """Main process control panel holding only the shape parameter textbox.
+    """
+    def __init__(self, q:mp.Queue)->None:
+        """Constructor requiring the queue feeding the worker process.
+
+        Args:
+            q (mp.Queue): Queue of shape parameter values to the worker.
+        """
+        self.q = q
+
+        self.fig = plt.figure(figsize=(3, 1))
+        self.fig.suptitle("Weibull Control", weight="bold")
+        m_tbox_ax = self.fig.add_axes([0.3, 0.2, 0.4, 0.4])
+        self.m_tbox = TextBox(m_tbox_ax, "m", textalignment="left")
+        self.m_tbox.set_val("1.0")
+        # Hook up update method to the event
+        self.m_tbox.on_submit(self.m_update)
+
+        print("Weibull control panel initiated")
+
+    def m_update(self, val:Union[str,int])->None:
+        """Method to enqueue a new shape parameter for the worker.
+
+        Args:
+            val (Union[str,int]): Value to update.
+        """
+        try:
+            m = float(val)
+        except ValueError:
+            print("Invalid shape parameter")
+            return
+
+        # Drop stale values so a burst of submits renders only the newest m
+        while True:
+            try:
+                self.q.get_nowait()
+            except queue.Empty:
+                break
+        print(f"New shape parameter m {m}")
+        self.q.put(m)
+
+if __name__ == "__main__":
+    """Main entry point into multiprocessing Weibull plotter.
+    """
+    # Set the matplotlib plotting backend
+    backend = matplotlib.get_backend()
+    if backend != 'Qt5Agg':
+        matplotlib.use("Qt5Agg") # macosx backend is buggy for textbox widget. qt5 seems decent.
+    print(f"Using backend {matplotlib.get_backend()}")
+
+    q = mp.Queue()
+    worker = mp.Process(target=plot_worker, args=(q,), daemon=True)
+    worker.start()
+
+    panel = m_control(q) # Textbox-only control panel in the main process
+    plt.show()
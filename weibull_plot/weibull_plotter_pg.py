@@ -0,0 +1,101 @@
+"""Opt-in pyqtgraph variant of the Weibull plotter.
+
+Uses a pg.GraphicsLayoutWidget with three PlotItems instead of matplotlib, so a
+shape parameter update only re-uploads the curve vertex data and never
+re-renders the axes. Requires pyqtgraph; the matplotlib plotter in
+weibull_plotter.py stays the default.
+"""
+import pyqtgraph as pg
+from pyqtgraph.Qt import QtWidgets
+from typing import Final
+
+from weibull_plotter import weibull_model, SHAPE_PARAMETER
+
+# Widget default settings
+WIN_HEIGHT:Final[int] = 600
+WIN_WIDTH:Final[int] = 900
+M_MIN:Final[float] = 0.1
+M_MAX:Final[float] = 10.0
+M_STEP:Final[float] = 0.1
+
+class weibull_plot_pg:
+    """Class to generate pyqtgraph Weibull plots for given Weibull model.
+    """
+    def __init__(self, model:weibull_model)->None:
+        """Constructor requiring Weibull model object.
+
+        Args:
+            model (weibull_model): Weibull model object with Weibull parameters and data.
+        """
+        self.model = model
+
+        # Top-level widget: plots above, shape parameter spinbox below
+        self.widget = QtWidgets.QWidget()
+        self.widget.setWindowTitle("Weibull Model")
+        self.widget.resize(WIN_WIDTH, WIN_HEIGHT)
+        layout = QtWidgets.QVBoxLayout(self.widget)
+
+        self.glw = pg.GraphicsLayoutWidget()
+        layout.addWidget(self.glw)
+
+        # Generate plot items and curves
+        self.cdf_plot = self.glw.addPlot(title="Cumulative Density Function")
+        self.pdf_plot = self.glw.addPlot(title="Probability Density Function")
+        self.glw.nextRow()
+        self.h_plot = self.glw.addPlot(title="Failure Rate")
+
+        self.cdf_curve = self.cdf_plot.plot(self.model.t_data, self.model.cdf_data)
+        self.pdf_curve = self.pdf_plot.plot(self.model.t_data, self.model.pdf_data)
+        self.h_curve = self.h_plot.plot(self.model.t_data, self.model.h_data)
+
+        # Plot axis labels and grid
+        self.cdf_plot.setLabel("left", "F(t)")
+        self.pdf_plot.setLabel("left", "f(t)", units="1/c")
+        self.h_plot.setLabel("left", "h(t)", units="1/c")
+        for p in [self.cdf_plot, self.pdf_plot, self.h_plot]:
+            p.setLabel("bottom", "t", units="c")
+            p.showGrid(x=True, y=True)
+
+        # Spinbox for shape parameter m
+        row = QtWidgets.QHBoxLayout()
+        row.addWidget(QtWidgets.QLabel("m"))
+        self.m_spinbox = QtWidgets.QDoubleSpinBox()
+        self.m_spinbox.setRange(M_MIN, M_MAX)
+        self.m_spinbox.setSingleStep(M_STEP)
+        self.m_spinbox.setValue(SHAPE_PARAMETER)
+        # Hook up update method to the event
+        self.m_spinbox.valueChanged.connect(self.m_update)
+        row.addWidget(self.m_spinbox)
+        row.addStretch()
+        layout.addLayout(row)
+
+        print("Weibull pyqtgraph plotter initiated")
+
+    def m_update(self, m:float)->None:
+        """Method to update shape parameter and refresh model data.
+
+        Args:
+            m (float): Value to update.
+        """
+        print(f"New shape parameter m {m}")
+        self.model.update_m(m)
+        self.update_data()
+
+    def update_data(self)->None:
+        """Method to refresh model data.
+        """
+        # setData re-uploads only the curve vertices; axes are untouched
+        self.cdf_curve.setData(self.model.t_data, self.model.cdf_data)
+        self.pdf_curve.setData(self.model.t_data, self.model.pdf_data)
+        self.h_curve.setData(self.model.t_data, self.model.h_data)
+
+if __name__ == "__main__":
+    """Main entry point into pyqtgraph Weibull plotter.
+    """
+    app = pg.mkQApp("Weibull Model")
+
+    mm = weibull_model() # Create Weibull model
+    pp = weibull_plot_pg(mm) # Pass model into plotter
+    pp.widget.show()
+
+    app.exec()